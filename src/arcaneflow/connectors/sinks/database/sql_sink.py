@@ -1,21 +1,85 @@
-from typing import Type
-from sqlalchemy.orm import DeclarativeMeta
+import csv
+import io
+from typing import Any, Dict, Iterator, List, Type
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Column, Integer, insert
+from sqlalchemy.orm import DeclarativeMeta, Session
 
 from ....core.interfaces.context import PipelineContext
 from ....core.interfaces.etl_node import ETLNode
 
+# DBAPI drivers whose cursors expose a COPY FROM STDIN API
+_COPY_DRIVERS = ("psycopg2", "psycopg")
+# Below this many rows a multi-VALUES INSERT beats COPY's setup cost
+_COPY_MIN_ROWS = 100
+# Marks NULL in COPY payloads, so empty strings stay distinguishable
+_COPY_NULL = "\\N"
+
+
+def _iter_batches(df: pd.DataFrame, n: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the rows of ``df`` as lists of at most ``n`` record dicts.
+
+    Each batch is built column-wise: every column slice is converted to a
+    list of Python scalars in one call and the lists are zipped into rows,
+    so no per-row Series or tuple boxing happens. Only one batch of dicts is
+    alive at a time, so peak memory is bounded by ``n`` rather than by the
+    length of the frame. Missing values are sent as None, i.e. NULL.
+    """
+    columns = tuple(df.columns)
+    for start in range(0, len(df), n):
+        chunk = df.iloc[start : start + n]
+        values = [_column_values(column) for _, column in chunk.items()]
+        yield [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _column_values(column: pd.Series) -> List[Any]:
+    """Return ``column`` as Python scalars with every missing value as None.
+
+    ``tolist`` keeps ``pd.NA``, ``NaN`` and ``NaT`` as-is, which DBAPI drivers
+    either reject or store as non-NULL values.
+    """
+    values = column.tolist()
+    missing = column.isna()
+    if missing.any():
+        values = [
+            None if is_missing else value
+            for value, is_missing in zip(values, missing.tolist())
+        ]
+    return values
+
+
+def _is_integral(column: pd.Series) -> bool:
+    """Return whether every non-missing value of a float ``column`` is whole."""
+    values = column.dropna().to_numpy(dtype="float64")
+    return bool(np.all(np.mod(values, 1) == 0))
+
 
 class SQLAlchemySink(ETLNode):
     def __init__(self, model: Type[DeclarativeMeta], batch_size: int = 1000) -> None:
         self.model = model
         self.batch_size = batch_size
+        self._node_id = f"SQLAlchemySink_{model.__tablename__}"
+        # Built once so every batch reuses the same statement and its
+        # compiled form from the engine's statement cache
+        self._insert_stmt = insert(model)
 
     @property
     def node_id(self) -> str:
-        return f"SQLAlchemySink_{self.model.__tablename__}"
+        return self._node_id
 
     def execute(self, context: PipelineContext) -> PipelineContext:
-        """Execute the SQL insertion using the current session in context"""
+        """Execute the SQL insertion using the current session in context.
+
+        On PostgreSQL with psycopg2 or psycopg, frames of more than
+        ``_COPY_MIN_ROWS`` rows are loaded batch by batch with
+        ``COPY ... FROM STDIN``. Smaller frames and other dialects stream
+        rows in batches of ``batch_size``; each batch is sent as a Core
+        ``INSERT`` executemany, which SQLAlchemy's ``insertmanyvalues``
+        feature renders as multi-VALUES statements. Either way, frame
+        columns that are not model columns are ignored.
+        """
         try:
             session = context.session
         except ValueError as e:
@@ -23,12 +87,92 @@ class SQLAlchemySink(ETLNode):
                 "SQL session not available in context. Make sure to call pipeline.execute(session=session)"
             )
 
-        data = context.data.to_dict("records")
-
-        for i in range(0, len(data), self.batch_size):
-            batch = data[i : i + self.batch_size]
-            session.bulk_insert_mappings(self.model, batch)
+        dialect = session.get_bind().dialect
+        if (
+            dialect.name == "postgresql"
+            and dialect.driver in _COPY_DRIVERS
+            and len(context.data) > _COPY_MIN_ROWS
+        ):
+            processed_rows = self._copy(session, context.data)
+        else:
+            processed_rows = self._insert(session, context.data)
 
-        context.metadata["processed_rows"] = len(data)
+        context.metadata["processed_rows"] = processed_rows
 
         return context
+
+    def _insert(self, session: Session, df: pd.DataFrame) -> int:
+        processed_rows = 0
+
+        for batch in _iter_batches(df, self.batch_size):
+            session.execute(
+                self._insert_stmt,
+                batch,
+                execution_options={"insertmanyvalues_page_size": self.batch_size},
+            )
+            processed_rows += len(batch)
+
+        return processed_rows
+
+    def _copy(self, session: Session, df: pd.DataFrame) -> int:
+        dialect = session.get_bind().dialect
+        preparer = dialect.identifier_preparer
+        table_columns = self._copy_columns(df)
+        data = df[[column.key for column in table_columns]]
+        columns = ", ".join(preparer.quote(column.name) for column in table_columns)
+        # Text values are quoted, so FORCE_NULL is needed for the quoted marker
+        sql = (
+            f"COPY {preparer.format_table(self.model.__table__)} ({columns}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}', "
+            f"FORCE_NULL ({columns}))"
+        )
+
+        cursor = session.connection().connection.cursor()
+        try:
+            for start in range(0, len(data), self.batch_size):
+                payload = self._copy_payload(data.iloc[start : start + self.batch_size])
+                if dialect.driver == "psycopg2":
+                    cursor.copy_expert(sql, io.StringIO(payload))
+                else:
+                    with cursor.copy(sql) as copy:
+                        copy.write(payload)
+        finally:
+            cursor.close()
+
+        return len(df)
+
+    def _copy_columns(self, df: pd.DataFrame) -> List[Column]:
+        """Return the model's columns whose ``Column.key`` is a column of ``df``.
+
+        INSERT binds frame columns to table columns by key and ignores the
+        rest, so COPY loads exactly the same columns.
+        """
+        return [column for column in self.model.__table__.columns if column.key in df]
+
+    def _copy_payload(self, chunk: pd.DataFrame) -> str:
+        """Render ``chunk`` as COPY CSV holding the same values as an INSERT.
+
+        Missing values are written as ``_COPY_NULL`` and text is quoted, so
+        empty strings load as empty strings rather than NULL. Float columns
+        bound to integer columns whose values are all integral, i.e. integers
+        widened by missing values, are written without a fractional part;
+        other floats are written as-is, as INSERT passes them through.
+        """
+        table_columns = self.model.__table__.columns
+        integer_columns = {
+            name: "Int64"
+            for name, column in chunk.items()
+            if name in table_columns
+            and isinstance(table_columns[name].type, Integer)
+            and pd.api.types.is_float_dtype(column.dtype)
+            and _is_integral(column)
+        }
+        if integer_columns:
+            chunk = chunk.astype(integer_columns)
+
+        return chunk.to_csv(
+            index=False,
+            header=False,
+            na_rep=_COPY_NULL,
+            quoting=csv.QUOTE_NONNUMERIC,
+        )
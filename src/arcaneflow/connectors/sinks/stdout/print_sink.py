@@ -1,4 +1,7 @@
 from typing import Optional
+
+import pandas as pd
+
 from ....core.interfaces.context import PipelineContext
 from ....core.interfaces.etl_node import ETLNode
 
@@ -9,17 +12,29 @@ class PrintSink(ETLNode):
         Initialize a simple PrintSink that outputs data to console for testing.
 
         Args:
-            limit (Optional[int]): Number of rows to print using df.head(). Default is 5.
+            limit (Optional[int]): Number of rows to print using df.head(). Default is 5;
+                ``0`` or ``None`` disables printing.
         """
         self.limit = limit
+        self._node_id = "PrintSink"
 
     @property
     def node_id(self) -> str:
-        return "PrintSink"
+        return self._node_id
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         """Print the data for testing purposes using pandas' built-in head() method"""
+        if not self.limit:
+            return context
+
         data = context.data
+        if not isinstance(data, pd.DataFrame):
+            # Row counts and head() only make sense for frames
+            print(f"\n===== PrintSink: {type(data).__name__} =====")
+            print(repr(data))
+            print(f"===== End of PrintSink output =====\n")
+            return context
+
         row_count = len(data)
 
         print(f"\n===== PrintSink: {row_count} total rows =====")
@@ -1,19 +1,255 @@
+import csv
+from typing import Iterator, Optional
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 from arcaneflow.core.interfaces.context import PipelineContext
 from ....core.interfaces.etl_node import ETLNode
 
+_ENGINES = ("pyarrow", "c")
+# Keyword arguments understood by pyarrow.csv.read_csv / open_csv
+_ARROW_KWARGS = frozenset(
+    ("read_options", "parse_options", "convert_options", "memory_pool")
+)
+
+
+# pyarrow options that change the parsed result but have no pd.read_csv
+# counterpart, so the pandas fallback cannot honour them
+_UNTRANSLATABLE_OPTIONS = (
+    "skip_rows_after_names",
+    "autogenerate_column_names",
+    "include_missing_columns",
+    "auto_dict_encode",
+    "timestamp_parsers",
+    "default_column_type",
+)
+
+
+def _skip_blank_row(row: pacsv.InvalidRow) -> str:
+    """Drop whitespace-only lines, which pd.read_csv skips as blank."""
+    return "skip" if not row.text.strip() else "error"
+
+
+def _drop_blank_rows(table: pa.Table) -> pa.Table:
+    """Drop whitespace-only lines from a single-column table.
+
+    With one column such lines parse as valid rows instead of reaching
+    ``_skip_blank_row``. They also force the column to text, so after dropping
+    them the column is re-typed as integer or float where possible.
+    """
+    if table.num_columns != 1 or not pa.types.is_string(table.column(0).type):
+        return table
+
+    column = table.column(0)
+    blank = pc.match_substring_regex(column, r"^\s+$")
+    if not pc.any(blank).as_py():
+        return table
+
+    column = column.filter(pc.invert(pc.fill_null(blank, False)))
+    for target in (pa.int64(), pa.float64()):
+        try:
+            column = column.cast(target)
+            break
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    return pa.table([column], names=table.column_names)
+
 
 class CSVSource(ETLNode):
-    def __init__(self, file_path: str, **read_csv_kwargs) -> str:
+    def __init__(
+        self,
+        file_path: str,
+        engine: str = "pyarrow",
+        chunksize: Optional[int] = None,
+        **read_csv_kwargs,
+    ):
+        """
+        Initialize a CSV source.
+
+        Args:
+            file_path (str): Path of the CSV file to read.
+            engine (str): ``"pyarrow"`` (default) parses with ``pyarrow.csv`` and
+                yields Arrow-backed columns; ``"c"`` falls back to ``pd.read_csv``
+                with NumPy dtypes.
+            chunksize (Optional[int]): When set, ``execute`` stores an iterator of
+                DataFrames of at most this many rows in ``context.data`` instead
+                of loading the whole file, and the pipeline runs its nodes once
+                per chunk. Throughput dips slightly, but peak memory stays at one
+                chunk rather than the whole file.
+            **read_csv_kwargs: Forwarded to ``pyarrow.csv.read_csv`` (e.g.
+                ``parse_options``, ``convert_options``) or to ``pd.read_csv``,
+                depending on the engine. Any pandas-only keyword (e.g. ``sep``,
+                ``dtype``, ``usecols``) switches the source to the ``"c"``
+                engine.
+        """
+        if engine not in _ENGINES:
+            raise ValueError(
+                f"Unsupported CSV engine '{engine}', expected one of {_ENGINES}"
+            )
+        if engine == "pyarrow" and not _ARROW_KWARGS.issuperset(read_csv_kwargs):
+            engine = "c"
         self.file_path = file_path
+        self.engine = engine
+        self.chunksize = chunksize
         self.read_csv_kwargs = read_csv_kwargs
+        self._node_id = f"CSVSource_{file_path}"
 
     @property
     def node_id(self) -> str:
-        return f"CSVSource_{self.file_path}"
+        return self._node_id
 
     def execute(self, context: PipelineContext):
-        context.data = pd.read_csv(self.file_path, **self.read_csv_kwargs)
+        if self.chunksize:
+            if self.engine == "pyarrow":
+                context.data = self._iter_arrow_chunks()
+            else:
+                context.data = self._iter_c_chunks()
+        elif self.engine == "pyarrow":
+            context.data = self._read_arrow()
+        else:
+            context.data = pd.read_csv(self.file_path, **self.read_csv_kwargs)
         context.metadata["source"] = self.file_path
         return context
+
+    def _arrow_options(self) -> dict:
+        return {
+            "read_options": pacsv.ReadOptions(block_size=32 << 20, use_threads=True),
+            "parse_options": pacsv.ParseOptions(invalid_row_handler=_skip_blank_row),
+            # Read empty cells of text columns as null, as pd.read_csv does
+            "convert_options": pacsv.ConvertOptions(strings_can_be_null=True),
+            **self.read_csv_kwargs,
+        }
+
+    def _read_arrow(self) -> pd.DataFrame:
+        table = _drop_blank_rows(
+            pacsv.read_csv(self.file_path, **self._arrow_options())
+        )
+        # self_destruct releases each Arrow column as soon as pandas owns it
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+    def _iter_arrow_chunks(self) -> Iterator[pd.DataFrame]:
+        reader = pacsv.open_csv(self.file_path, **self._arrow_options())
+        pending = pa.Table.from_batches([], schema=reader.schema)
+        emitted = 0
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            except pa.ArrowInvalid as error:
+                # open_csv infers column types from the first block only, so a
+                # later value of another type fails the stream; finish the file
+                # with the pandas reader, which infers types per chunk
+                try:
+                    read_csv_kwargs = self._pandas_kwargs()
+                except ValueError as unsupported:
+                    raise ValueError(
+                        f"Cannot finish reading {self.file_path} with pandas after "
+                        f"a type change past the first block ({error}): "
+                        f"{unsupported}. Pin the column types with "
+                        "ConvertOptions(column_types=...) instead."
+                    ) from error
+                for frame in self._iter_c_chunks(emitted, read_csv_kwargs):
+                    yield frame[reader.schema.names].reset_index(drop=True)
+                return
+            pending = pa.concat_tables([pending, pa.Table.from_batches([batch])])
+            while pending.num_rows >= self.chunksize:
+                chunk = pending.slice(0, self.chunksize)
+                pending = pending.slice(self.chunksize)
+                frame = _drop_blank_rows(chunk).to_pandas(types_mapper=pd.ArrowDtype)
+                emitted += len(frame)
+                yield frame
+        if pending.num_rows:
+            yield _drop_blank_rows(pending).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _pandas_kwargs(self) -> dict:
+        """Translate the pyarrow options into equivalent ``pd.read_csv`` keywords.
+
+        Columns stay Arrow-backed through ``dtype_backend="pyarrow"``. Options
+        that only tune pyarrow's reader (block size, threads, UTF-8 checks)
+        are dropped.
+
+        Raises:
+            ValueError: If an option changes the result and has no pandas
+                equivalent
+        """
+        read = self.read_csv_kwargs.get("read_options") or pacsv.ReadOptions()
+        parse = self.read_csv_kwargs.get("parse_options") or pacsv.ParseOptions()
+        convert = self.read_csv_kwargs.get("convert_options") or pacsv.ConvertOptions()
+        defaults = (pacsv.ReadOptions(), pacsv.ParseOptions(), pacsv.ConvertOptions())
+        unsupported = [
+            name
+            for options, default in zip((read, parse, convert), defaults)
+            for name in _UNTRANSLATABLE_OPTIONS
+            if hasattr(default, name)
+            and getattr(options, name) != getattr(default, name)
+        ]
+        if unsupported:
+            raise ValueError(
+                f"pyarrow option(s) {', '.join(unsupported)} have no "
+                "pd.read_csv equivalent"
+            )
+
+        default_convert = defaults[2]
+        kwargs = {
+            "dtype_backend": "pyarrow",
+            "sep": parse.delimiter,
+            "doublequote": parse.double_quote,
+            "skip_blank_lines": parse.ignore_empty_lines,
+            "skiprows": read.skip_rows,
+            "encoding": read.encoding,
+            "decimal": convert.decimal_point,
+        }
+        if parse.quote_char:
+            kwargs["quotechar"] = parse.quote_char
+        else:
+            kwargs["quoting"] = csv.QUOTE_NONE
+        if parse.escape_char:
+            kwargs["escapechar"] = parse.escape_char
+        if read.column_names:
+            kwargs["names"] = list(read.column_names)
+            kwargs["header"] = None
+        if convert.include_columns:
+            kwargs["usecols"] = list(convert.include_columns)
+        if convert.column_types:
+            kwargs["dtype"] = {
+                name: pd.ArrowDtype(type_)
+                for name, type_ in convert.column_types.items()
+            }
+        if convert.null_values != default_convert.null_values:
+            kwargs["na_values"] = list(convert.null_values)
+            kwargs["keep_default_na"] = False
+        # Only forward changed boolean spellings; pandas would otherwise turn
+        # 0/1 columns, which pyarrow reads as integers, into booleans
+        if convert.true_values != default_convert.true_values:
+            kwargs["true_values"] = list(convert.true_values)
+        if convert.false_values != default_convert.false_values:
+            kwargs["false_values"] = list(convert.false_values)
+        return kwargs
+
+    def _iter_c_chunks(
+        self, skip_rows: int = 0, read_csv_kwargs: Optional[dict] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Yield pandas chunks, dropping the first ``skip_rows`` data rows.
+
+        Args:
+            skip_rows: Data rows already handed out by another reader
+            read_csv_kwargs: Keywords for ``pd.read_csv``; defaults to the ones
+                given to the source
+        """
+        if read_csv_kwargs is None:
+            read_csv_kwargs = self.read_csv_kwargs
+        with pd.read_csv(
+            self.file_path, chunksize=self.chunksize, **read_csv_kwargs
+        ) as reader:
+            for frame in reader:
+                if skip_rows >= len(frame):
+                    skip_rows -= len(frame)
+                    continue
+                if skip_rows:
+                    frame = frame.iloc[skip_rows:]
+                    skip_rows = 0
+                yield frame
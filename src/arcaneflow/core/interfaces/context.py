@@ -1,25 +1,22 @@
 import logging
-from abc import ABC, abstractmethod
-from typing import Generator, Optional, Dict, Any
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from dataclasses import dataclass, field
+from typing import Generator, Dict, Any, TYPE_CHECKING
 from contextlib import contextmanager
 
-logging.basicConfig(level=logging.DEBUG)
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 logger = logging.getLogger(__name__)
 
 
-class PipelineContext(BaseModel):
-    data: Optional[Any] = None
-    metadata: Optional[Dict[str, Any]] = {}
-    _session: Optional[Any] = None
+@dataclass(slots=True)
+class PipelineContext:
+    data: Any = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    _session: Any = None
 
     @property
-    def session(self) -> Session:
-        logger.debug(
-            "Session property accessed, _session is %s",
-            "available" if self._session else "None",
-        )
+    def session(self) -> "Session":
         if self._session is None:
             logger.error(
                 "No active database session when trying to access session property"
@@ -28,13 +25,12 @@ class PipelineContext(BaseModel):
         return self._session
 
     @contextmanager
-    def with_session(self, session: Session) -> Generator[None, None, None]:
+    def with_session(self, session: "Session") -> Generator[None, None, None]:
         """Context manager for session management"""
         logger.debug("Setting session in context")
         self._session = session
         try:
             yield
-            logger.debug("Session context manager exiting normally")
         except Exception as e:
             logger.error("Exception in session context: %s", str(e))
             raise
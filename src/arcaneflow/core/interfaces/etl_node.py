@@ -1,12 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from typing import Optional
 
 from .context import PipelineContext
 from .transformation_signature import TransformationSignature
 
 
 class ETLNode(ABC):
+    # Set to True by subclasses that implement get_transformation_signature
+    provides_signature: bool = False
+    # Set to True by side-effect-free nodes whose output CachingPipeline may
+    # memoize; the result must depend only on the input data and the node's
+    # public attributes
+    cacheable: bool = False
+    # Set to True by column-only nodes that implement fuse
+    fuseable: bool = False
+
     @property
     @abstractmethod
     def node_id(self) -> str:
@@ -25,3 +33,10 @@ class ETLNode(ABC):
         raise NotImplementedError(
             "Subclasses must implement get_transformation_signature"
         )
+
+    def fuse(self, other: "ETLNode") -> Optional["ETLNode"]:
+        """Return one node equivalent to running ``self`` then ``other``.
+
+        Returns None when the two nodes cannot be combined.
+        """
+        return None
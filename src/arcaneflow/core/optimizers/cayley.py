@@ -1,5 +1,4 @@
-from typing import Dict, FrozenSet, List, Set
-import networkx as nx
+from typing import List, Set
 
 from .graph.transformation_graph_builder import TransformationGraphBuilder
 
@@ -32,34 +31,31 @@ class CayleyGraphOptimizer:
             self.optimizers = optimizers
 
     def optimize_pipeline(self, pipeline: "Pipeline") -> "Pipeline":
+        """Drop redundant nodes from ``pipeline`` in place and return it."""
 
-        # Build the transformation graph
-        graph = self.graph_builder.build_graph(pipeline)
-
-        # Collect redundancies from all optimization strategies
-        redundant_nodes = set()
-        for optimizer in self.optimizers:
-            redundant_nodes.update(optimizer.identify_redundancies(graph))
+        redundant_nodes = self._collect_redundancies(pipeline)
 
         if not redundant_nodes:
             # No optimizations found
             return pipeline
 
-        # Create optimized pipeline with non-redundant nodes
-        optimized_nodes = [
+        # Rebind to a new list so a builder sharing the old one is unaffected
+        pipeline.nodes = [
             node for node in pipeline.nodes if node.node_id not in redundant_nodes
         ]
 
-        return Pipeline(pipeline.source, optimized_nodes, pipeline.sink)
+        return pipeline
 
     def get_redundant_nodes(self, pipeline: "Pipeline") -> List[str]:
 
-        # Build the transformation graph
+        return list(self._collect_redundancies(pipeline))
+
+    def _collect_redundancies(self, pipeline: "Pipeline") -> Set[str]:
+        """Build the transformation graph and merge every strategy's findings."""
         graph = self.graph_builder.build_graph(pipeline)
 
-        # Collect redundancies from all optimization strategies
         redundant_nodes = set()
         for optimizer in self.optimizers:
             redundant_nodes.update(optimizer.identify_redundancies(graph))
 
-        return list(redundant_nodes)
+        return redundant_nodes
@@ -1,4 +1,5 @@
-from typing import Dict, FrozenSet, Set, Optional, Any
+import warnings
+from typing import Dict, FrozenSet, Set, Any
 
 
 class SchemaStateManager:
@@ -6,6 +7,17 @@ class SchemaStateManager:
         self.schema_to_node_name: Dict[FrozenSet, str] = {}
 
     def get_or_create_node(self, schema: FrozenSet) -> str:
+        """Return a stable node name for ``schema``.
+
+        Deprecated: graph nodes are now deduplicated by
+        ``TransformationGraph.add_node``, which returns an integer index.
+        """
+        warnings.warn(
+            "SchemaStateManager.get_or_create_node is deprecated; use "
+            "TransformationGraph.add_node instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if schema in self.schema_to_node_name:
             return self.schema_to_node_name[schema]
 
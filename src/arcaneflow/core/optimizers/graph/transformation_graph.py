@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+@dataclass(slots=True)
+class TransformationGraph:
+    """Schema-state graph of a pipeline stored as parallel arrays.
+
+    Nodes are schema states addressed by index; edge ``i`` goes from
+    ``node_schemas[edges_src[i]]`` to ``node_schemas[edges_dst[i]]`` and is
+    produced by the ETL node ``edge_node_ids[i]``.
+    """
+
+    node_schemas: List[FrozenSet[str]] = field(default_factory=list)
+    edges_src: List[int] = field(default_factory=list)
+    edges_dst: List[int] = field(default_factory=list)
+    edge_node_ids: List[str] = field(default_factory=list)
+    edge_signatures: List[Any] = field(default_factory=list)
+    schema_to_node_idx: Dict[FrozenSet[str], int] = field(default_factory=dict)
+
+    def add_node(self, schema: FrozenSet[str]) -> int:
+        """Return the index of ``schema``, adding it if it is not yet a node."""
+        index = self.schema_to_node_idx.get(schema)
+        if index is None:
+            index = len(self.node_schemas)
+            self.node_schemas.append(schema)
+            self.schema_to_node_idx[schema] = index
+        return index
+
+    def add_edge(self, src: int, dst: int, node_id: str, signature: Any) -> None:
+        """Record the transition from state ``src`` to ``dst`` made by ``node_id``."""
+        self.edges_src.append(src)
+        self.edges_dst.append(dst)
+        self.edge_node_ids.append(node_id)
+        self.edge_signatures.append(signature)
+
+    def to_networkx(self) -> "nx.DiGraph":
+        """Build the equivalent ``networkx.DiGraph`` for analysis or plotting.
+
+        Nodes are named ``schema_<index>`` and carry a ``schema`` attribute;
+        edges carry ``node_id`` and ``signature``.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        for index, schema in enumerate(self.node_schemas):
+            graph.add_node(f"schema_{index}", schema=schema)
+        for src, dst, node_id, signature in zip(
+            self.edges_src, self.edges_dst, self.edge_node_ids, self.edge_signatures
+        ):
+            graph.add_edge(
+                f"schema_{src}", f"schema_{dst}", node_id=node_id, signature=signature
+            )
+        return graph
@@ -1,21 +1,20 @@
-from typing import Dict, FrozenSet, List, Set, Any, Optional
-import networkx as nx
-
+from typing import FrozenSet, List, Set, Any, Optional
 
+from .transformation_graph import TransformationGraph
 from ...pipeline.builder import Pipeline
 
 
 class TransformationGraphBuilder:
     def __init__(self, schema_manager):
-        self.graph = nx.DiGraph()
         self.schema_manager = schema_manager
 
-    def build_graph(self, pipeline: "Pipeline") -> nx.DiGraph:
+    def build_graph(self, pipeline: "Pipeline") -> TransformationGraph:
+        graph = TransformationGraph()
         all_nodes = self._collect_pipeline_nodes(pipeline)
 
         schema_state: Set = set()
         initial_schema = frozenset(schema_state)
-        initial_state = self._add_schema_node(initial_schema)
+        initial_state = self._add_schema_node(graph, initial_schema)
         current_state = initial_state
 
         for node in all_nodes:
@@ -25,7 +24,7 @@ class TransformationGraphBuilder:
 
             node_id = node.node_id
             next_state = self._process_transformation(
-                schema_state, signature, current_state, node_id
+                graph, schema_state, signature, current_state, node_id
             )
 
             current_state = next_state
@@ -33,12 +32,10 @@ class TransformationGraphBuilder:
                 schema_state, signature
             )
 
-        return self.graph
+        return graph
 
-    def _add_schema_node(self, schema: FrozenSet) -> str:
-        node_name = self.schema_manager.get_or_create_node(schema)
-        self.graph.add_node(node_name, schema=schema)
-        return node_name
+    def _add_schema_node(self, graph: TransformationGraph, schema: FrozenSet) -> int:
+        return graph.add_node(schema)
 
     def _collect_pipeline_nodes(self, pipeline: "Pipeline") -> List:
         all_nodes = []
@@ -51,25 +48,25 @@ class TransformationGraphBuilder:
 
     def _get_node_signature(self, node) -> Optional[Any]:
 
-        if not hasattr(node, "get_transformation_signature"):
+        if not node.provides_signature:
             return None
 
-        try:
-            return node.get_transformation_signature()
-        except NotImplementedError:
-            return None
+        return node.get_transformation_signature()
 
     def _process_transformation(
-        self, schema_state: Set, signature, current_state: str, node_id: str
-    ) -> str:
+        self,
+        graph: TransformationGraph,
+        schema_state: Set,
+        signature,
+        current_state: int,
+        node_id: str,
+    ) -> int:
 
         next_schema_state = self.schema_manager.calculate_next_state(
             schema_state, signature
         )
         next_schema_frozen = frozenset(next_schema_state)
-        next_state = self._add_schema_node(next_schema_frozen)
+        next_state = self._add_schema_node(graph, next_schema_frozen)
 
-        self.graph.add_edge(
-            current_state, next_state, node_id=node_id, signature=signature
-        )
+        graph.add_edge(current_state, next_state, node_id, signature)
         return next_state
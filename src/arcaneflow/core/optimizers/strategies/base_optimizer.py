@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-import networkx as nx
 from typing import Set, List
 
+from ..graph.transformation_graph import TransformationGraph
+
 
 class BaseOptimizer(ABC):
     @abstractmethod
-    def identify_redundancies(self, graph: nx.DiGraph) -> Set[str]:
+    def identify_redundancies(self, graph: TransformationGraph) -> Set[str]:
         """
         Identify redundant nodes in the transformation graph.
 
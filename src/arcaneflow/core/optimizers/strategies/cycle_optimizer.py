@@ -1,33 +1,52 @@
-import networkx as nx
+from graphlib import CycleError, TopologicalSorter
 from typing import Set
 
 from .base_optimizer import BaseOptimizer
+from ..graph.transformation_graph import TransformationGraph
 
 
 class CycleOptimizer(BaseOptimizer):
     """Optimizer identifying redundant nodes in cycles within a directed graph."""
 
-    def identify_redundancies(self, graph: nx.DiGraph) -> Set[str]:
+    def identify_redundancies(self, graph: TransformationGraph) -> Set[str]:
         """Identify redundant nodes by examining cycles in the graph.
 
-        For each cycle detected, extracts 'node_id' from edges and marks them as redundant.
+        Acyclic graphs, the common case, are recognised with a topological
+        sort over the edge arrays and return immediately. Otherwise an edge
+        lies on a cycle exactly when both of its endpoints belong to the same
+        strongly connected component, which is checked in linear time.
 
         Args:
-            graph: The directed graph to analyze for cyclical redundancies.
+            graph: The transformation graph to analyze for cyclical redundancies.
 
         Returns:
             A set of redundant node IDs found in cycles.
         """
-        redundant_nodes = set()
+        predecessors = {index: [] for index in range(len(graph.node_schemas))}
+        for source, target in zip(graph.edges_src, graph.edges_dst):
+            predecessors[target].append(source)
+
         try:
-            for cycle in nx.simple_cycles(graph):
-                # Generate consecutive node pairs in the cycle
-                next_nodes = cycle[1:] + cycle[:1]
-                for u, v in zip(cycle, next_nodes):
-                    edge_data = graph.get_edge_data(u, v)
-                    if edge_data:
-                        redundant_nodes.add(edge_data["node_id"])
-        except nx.NetworkXNoCycle:
-            pass  # No cycles present
-
-        return redundant_nodes
+            TopologicalSorter(predecessors).prepare()
+            return set()
+        except CycleError:
+            pass
+
+        import networkx as nx
+
+        digraph = nx.DiGraph()
+        digraph.add_nodes_from(predecessors)
+        digraph.add_edges_from(zip(graph.edges_src, graph.edges_dst))
+
+        component_of = {}
+        for index, component in enumerate(nx.strongly_connected_components(digraph)):
+            for node in component:
+                component_of[node] = index
+
+        return {
+            node_id
+            for source, target, node_id in zip(
+                graph.edges_src, graph.edges_dst, graph.edge_node_ids
+            )
+            if component_of[source] == component_of[target]
+        }
@@ -1,25 +1,31 @@
-import networkx as nx
 from typing import Set
 
 from .base_optimizer import BaseOptimizer
+from ..graph.transformation_graph import TransformationGraph
 
 
 class RedundancyOptimizer(BaseOptimizer):
     """Optimizes graph by identifying redundant edges between nodes with matching schemas."""
 
-    def identify_redundancies(self, graph: nx.DiGraph) -> Set[str]:
+    def identify_redundancies(self, graph: TransformationGraph) -> Set[str]:
         """Detects redundant edges where connected nodes have identical schemas.
 
+        ``TransformationGraph.add_node`` gives equal schemas a single node,
+        so both ends of a redundant edge hold the same object and an identity
+        check suffices.
+
         Args:
-            graph: Input directed graph with node schemas and edge node_ids
+            graph: Transformation graph with node schemas and edge node_ids
 
         Returns:
             Set of node_ids from edges connecting nodes with duplicate schemas
         """
-        redundant_nodes = set()
-
-        for source, target, edge_data in graph.edges(data=True):
-            if graph.nodes[source]["schema"] == graph.nodes[target]["schema"]:
-                redundant_nodes.add(edge_data.get("node_id"))
-
-        return redundant_nodes
+        schemas = graph.node_schemas
+
+        return {
+            node_id
+            for source, target, node_id in zip(
+                graph.edges_src, graph.edges_dst, graph.edge_node_ids
+            )
+            if schemas[source] is schemas[target]
+        }
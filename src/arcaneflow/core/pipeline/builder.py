@@ -1,10 +1,42 @@
-from typing import List, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, Iterator, List, Optional, TYPE_CHECKING
 from contextlib import contextmanager
-from sqlalchemy.orm import Session
+
+import pandas as pd
 
 from ..interfaces.etl_node import ETLNode
 from ..interfaces.context import PipelineContext
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+# Number of parsed chunks allowed to wait for the consumer while streaming
+_STREAM_BUFFER_SIZE = 2
+_END_OF_STREAM = object()
+
+
+def _produce_chunks(
+    chunks: Iterator, buffer: queue.Queue, stop: threading.Event
+) -> None:
+    """Pull chunks from a source iterator into a bounded queue.
+
+    Runs on a worker thread so the next chunk is parsed while the current
+    one is transformed and written. Always finishes by queueing the
+    end-of-stream marker.
+    """
+    try:
+        for chunk in chunks:
+            if stop.is_set():
+                break
+            buffer.put(chunk)
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+        buffer.put(_END_OF_STREAM)
+
 
 class PipelineBuilder:
     """Constructs linear pipelines with optional branching.
@@ -85,9 +117,9 @@ class Pipeline:
         self.source = source
         self.nodes = nodes
         self.sink = sink
-        self._session: Optional[Session] = None
+        self._session: Optional["Session"] = None
 
-    def execute(self, session: Optional[Session] = None) -> PipelineContext:
+    def execute(self, session: Optional["Session"] = None) -> PipelineContext:
         """Execute the pipeline with optional database session.
 
         Args:
@@ -100,15 +132,28 @@ class Pipeline:
             Exception: Rolls back transaction on error if session provided
         """
         context = PipelineContext()
+        with self._session_ctx(context, session):
+            return self._execute_pipeline(context)
+
+    @contextmanager
+    def _session_ctx(
+        self, context: PipelineContext, session: Optional["Session"]
+    ) -> Generator[None, None, None]:
+        """Attach the session to the context and roll it back on error.
+
+        Args:
+            context: Context the session is bound to for the run
+            session: SQLAlchemy session, or None to run without one
+        """
+        if session is None:
+            yield
+            return
 
         try:
-            if session:
-                with context.with_session(session):
-                    return self._execute_pipeline(context)
-            return self._execute_pipeline(context)
-        except Exception as e:
-            if session:
-                session.rollback()
+            with context.with_session(session):
+                yield
+        except Exception:
+            session.rollback()
             raise
 
     def _execute_pipeline(self, context: PipelineContext) -> PipelineContext:
@@ -122,10 +167,84 @@ class Pipeline:
         """
         context = self.source.execute(context)
 
+        if isinstance(context.data, Iterator):
+            return self._execute_streaming(context)
+
+        return self._execute_nodes(context)
+
+    def _execute_streaming(self, context: PipelineContext) -> PipelineContext:
+        """Run the nodes and sink once per chunk produced by a chunked source.
+
+        A single producer thread reads ahead up to ``_STREAM_BUFFER_SIZE``
+        chunks, overlapping source parsing with transformation and sink I/O
+        (both largely release the GIL). Chunks are still processed in order
+        on the calling thread, so nodes and sessions are never shared across
+        threads.
+
+        Args:
+            context: Context whose data is an iterator of DataFrame chunks
+
+        Returns:
+            Context holding the last chunk, with processed_rows summed over
+            all chunks; an empty stream leaves an empty DataFrame and zero
+            processed_rows
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=_STREAM_BUFFER_SIZE)
+        stop = threading.Event()
+        processed_rows = 0
+        chunk_count = 0
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            producer = executor.submit(_produce_chunks, context.data, buffer, stop)
+            try:
+                while (chunk := buffer.get()) is not _END_OF_STREAM:
+                    chunk_count += 1
+                    context.data = chunk
+                    context = self._execute_nodes(context)
+                    processed_rows += context.metadata.get("processed_rows", 0)
+                producer.result()
+            finally:
+                # Unblock a producer still waiting on a full buffer
+                stop.set()
+                while not producer.done():
+                    try:
+                        buffer.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+
+        if not chunk_count:
+            # Don't leave the exhausted iterator behind as the result
+            context.data = pd.DataFrame()
+        if not chunk_count or "processed_rows" in context.metadata:
+            context.metadata["processed_rows"] = processed_rows
+
+        return context
+
+    def _execute_nodes(self, context: PipelineContext) -> PipelineContext:
+        """Run the processing nodes and the sink over the current data.
+
+        Args:
+            context: Context holding the source output
+
+        Returns:
+            Updated context after the sink, if any
+        """
         for node in self.nodes:
-            context = node.execute(context)
+            context = self._execute_node(node, context)
 
         if self.sink:
             context = self.sink.execute(context)
 
         return context
+
+    def _execute_node(self, node: ETLNode, context: PipelineContext) -> PipelineContext:
+        """Run a single processing node; overridden by caching pipelines.
+
+        Args:
+            node: Processing node to run
+            context: Context holding the node's input
+
+        Returns:
+            Context returned by the node
+        """
+        return node.execute(context)
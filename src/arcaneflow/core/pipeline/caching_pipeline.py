@@ -0,0 +1,90 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .builder import Pipeline
+from ..interfaces.etl_node import ETLNode
+from ..interfaces.context import PipelineContext
+
+
+class CachingPipeline(Pipeline):
+    """Pipeline memoizing the output of processing nodes across runs.
+
+    Results are keyed by the node's class and configuration (its public
+    instance attributes) and a content fingerprint of its input DataFrame,
+    so re-running the pipeline on unchanged data skips every cacheable
+    transformation. The source and sink always run. Only nodes declaring
+    ``cacheable = True`` are memoized; non-DataFrame data and frames that
+    cannot be hashed (e.g. holding lists or dicts) are never cached.
+
+    Cached frames are handed out as-is, so downstream nodes must not mutate
+    their input in place. At most ``max_entries`` results are kept, evicting
+    the least recently used; call ``clear_cache`` to release them all.
+    """
+
+    def __init__(
+        self,
+        source: ETLNode,
+        nodes: List[ETLNode],
+        sink: Optional[ETLNode],
+        max_entries: int = 128,
+    ) -> None:
+        super().__init__(source, nodes, sink)
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, bytes], Tuple[Any, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def clear_cache(self) -> None:
+        """Drop every memoized node result."""
+        self._cache.clear()
+
+    def _execute_node(self, node: ETLNode, context: PipelineContext) -> PipelineContext:
+        if not node.cacheable or not isinstance(context.data, pd.DataFrame):
+            return node.execute(context)
+
+        try:
+            fingerprint = self._fingerprint(context.data)
+        except TypeError:
+            # Unhashable cells such as lists or dicts
+            return node.execute(context)
+
+        key = (self._node_key(node), fingerprint)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            context.data, metadata_updates = cached
+            context.metadata.update(metadata_updates)
+            return context
+
+        metadata_before = dict(context.metadata)
+        context = node.execute(context)
+        metadata_updates = {
+            name: value
+            for name, value in context.metadata.items()
+            if name not in metadata_before or metadata_before[name] is not value
+        }
+        self._cache[key] = (context.data, metadata_updates)
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return context
+
+    @staticmethod
+    def _node_key(node: ETLNode) -> str:
+        """Class qualname plus the node's public attributes."""
+        config = sorted(
+            (name, value)
+            for name, value in getattr(node, "__dict__", {}).items()
+            if not name.startswith("_")
+        )
+        return f"{type(node).__module__}.{type(node).__qualname__}{config!r}"
+
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame) -> bytes:
+        """Digest of the frame's values, index, column labels and dtypes."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((list(df.columns), list(df.dtypes))).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.digest()
@@ -1,4 +1,7 @@
+from typing import List
+
 from .builder import Pipeline, PipelineBuilder
+from ..interfaces.etl_node import ETLNode
 from ..optimizers.cayley import CayleyGraphOptimizer
 
 
@@ -19,6 +22,9 @@ class OptimizingPipelineBuilder(PipelineBuilder):
     def build(self) -> "Pipeline":
         """Construct the configured pipeline with optional optimization.
 
+        With optimization enabled, adjacent fuseable nodes are fused and
+        redundant nodes are removed; disabled, nodes are used as configured.
+
         Returns:
             Fully configured Pipeline instance, potentially optimized
 
@@ -31,5 +37,25 @@ class OptimizingPipelineBuilder(PipelineBuilder):
         if not self.optimization_enabled:
             return Pipeline(self.source, self.nodes, self.sink)
 
-        optimizer = CayleyGraphOptimizer()
-        return optimizer.optimize_pipeline(Pipeline(self.source, self.nodes, self.sink))
+        pipeline = Pipeline(self.source, self._fused_nodes(), self.sink)
+        # The optimizer keeps per-run graph state, so builds never share one
+        return CayleyGraphOptimizer().optimize_pipeline(pipeline)
+
+    def _fused_nodes(self) -> List[ETLNode]:
+        """Collapse runs of adjacent fuseable nodes into single nodes.
+
+        Fusing e.g. consecutive column renames into one rename avoids an
+        intermediate DataFrame per step.
+
+        Returns:
+            New list of processing nodes; the builder's own list is untouched
+        """
+        fused: List[ETLNode] = []
+        for node in self.nodes:
+            if fused and fused[-1].fuseable and node.fuseable:
+                combined = fused[-1].fuse(node)
+                if combined is not None:
+                    fused[-1] = combined
+                    continue
+            fused.append(node)
+        return fused
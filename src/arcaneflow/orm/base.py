@@ -1,19 +1,109 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+# Applied to every connection of a file-backed SQLite database. WAL with
+# synchronous=NORMAL avoids an fsync per commit during bulk loads.
+_SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+}
+
 
 class SQLAManager:
     """Manages SQLAlchemy connections and sessions"""
 
-    def __init__(self, connection_string: str):
-        self.engine = create_engine(connection_string)
+    def __init__(
+        self,
+        connection_string: str,
+        insertmanyvalues_page_size: int = 1000,
+        executemany_batch_page_size: int = 500,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
+        pool_pre_ping: bool = False,
+        pool_recycle: Optional[int] = None,
+    ):
+        """
+        Args:
+            connection_string (str): SQLAlchemy database URL.
+            insertmanyvalues_page_size (int): Rows rendered into each
+                multi-VALUES INSERT when a statement is run with many
+                parameter sets.
+            executemany_batch_page_size (int): Statements sent per round trip
+                by psycopg2's ``execute_batch`` for UPDATE/DELETE
+                executemany. Ignored for other drivers.
+            sqlite_pragmas (Optional[Dict[str, Any]]): Overrides merged into
+                the PRAGMAs run on each new connection to a file-backed
+                SQLite database. In-memory databases are left untouched.
+            pool_pre_ping (bool): Test each pooled connection with a round trip
+                before checkout. Only worth it for long-lived processes.
+            pool_recycle (Optional[int]): Seconds after which pooled
+                connections are replaced, a cheaper guard against server-side
+                idle timeouts. Unset by default, and ignored for in-memory
+                SQLite, whose only connection holds the whole database.
+        """
+        url = make_url(connection_string)
+        in_memory = url.database in (None, "", ":memory:")
+        is_sqlite = url.get_backend_name() == "sqlite"
+        engine_kwargs = {}
+        if pool_recycle is not None and not (is_sqlite and in_memory):
+            engine_kwargs["pool_recycle"] = pool_recycle
+        if url.get_driver_name() == "psycopg2":
+            # Batch UPDATE/DELETE executemany through psycopg2's execute_batch
+            # as well; INSERTs already use multi-VALUES pages
+            engine_kwargs["executemany_mode"] = "values_plus_batch"
+            engine_kwargs["executemany_batch_page_size"] = executemany_batch_page_size
+
+        self.engine = create_engine(
+            connection_string,
+            insertmanyvalues_page_size=insertmanyvalues_page_size,
+            pool_pre_ping=pool_pre_ping,
+            **engine_kwargs,
+        )
+        if is_sqlite and not in_memory:
+            self._apply_sqlite_pragmas({**_SQLITE_PRAGMAS, **(sqlite_pragmas or {})})
         self.session = sessionmaker(bind=self.engine)
         self.base = declarative_base()
 
+    def _apply_sqlite_pragmas(self, pragmas: Dict[str, Any]) -> None:
+        """Run the given PRAGMAs on every new DBAPI connection.
+
+        Args:
+            pragmas: Mapping of PRAGMA name to value
+        """
+
+        @event.listens_for(self.engine, "connect")
+        def _set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
     def get_session(self):
         """Return a new SQLAlchemy session"""
-        return self.Session()
+        return self.session()
+
+    @contextmanager
+    def bulk_connection(self) -> Generator[Connection, None, None]:
+        """Yield a dedicated AUTOCOMMIT connection for bulk loads.
+
+        Statements such as ``COPY`` run outside a session transaction, so each
+        one is committed as soon as it completes and holds no pooled session
+        open while streaming.
+
+        Returns:
+            Connection checked out for the duration of the block
+        """
+        with self.engine.connect() as connection:
+            yield connection.execution_options(isolation_level="AUTOCOMMIT")
 
     class managed_session:
         """Context manager for database sessions"""
@@ -1,28 +1,76 @@
-from typing import Dict
+import hashlib
+import json
+import sys
+from typing import Dict, Optional
 
 from ...core.interfaces.transformation_signature import TransformationSignature
 from ...core.interfaces.etl_node import ETLNode
 from ...core.interfaces.context import PipelineContext
 import pandas as pd
 
+__all__ = ["ColumnRenamer"]
+
+
+def _label_sort_key(item):
+    """Order mapping items by label even when labels mix types, e.g. 0 and "a".
+
+    String labels sort by value, keeping existing node ids unchanged.
+    """
+    label = item[0]
+    return type(label).__name__, label if isinstance(label, str) else repr(label)
+
 
 class ColumnRenamer(ETLNode):
+    provides_signature = True
+    cacheable = True
+    fuseable = True
+
     def __init__(self, column_mapping: Dict[str, str]):
         self.column_mapping = column_mapping
         self._validate_mapping()
+        # Digest of the sorted mapping: unlike hash(), stable across processes
+        items = json.dumps(
+            sorted(self.column_mapping.items(), key=_label_sort_key), default=str
+        )
+        digest = hashlib.blake2b(items.encode(), digest_size=8).hexdigest()
+        self._node_id = f"ColumnRenamer_{digest}"
 
     @property
     def node_id(self) -> str:
-        return f"ColumnRenamer_{hash(frozenset(self.column_mapping.items()))}"
+        return self._node_id
 
     def execute(self, context: PipelineContext) -> PipelineContext:
         if not isinstance(context.data, pd.DataFrame):
             raise TypeError("ColumnRenamer requires pandas DataFrame input")
 
-        context.data = context.data.rename(columns=self.column_mapping)
-        context.metadata["columns"] = list(context.data.columns)
+        columns = context.data.columns
+        # Wide mappings often name columns the frame lacks; pass only the rest
+        present = {
+            old: new for old, new in self.column_mapping.items() if old in columns
+        }
+        # Only the column labels change, so share the data blocks
+        context.data = context.data.rename(columns=present, copy=False)
+        context.metadata["columns"] = tuple(
+            sys.intern(column) if isinstance(column, str) else column
+            for column in context.data.columns
+        )
         return context
 
+    def fuse(self, other: ETLNode) -> Optional["ColumnRenamer"]:
+        if not isinstance(other, ColumnRenamer):
+            return None
+
+        first, second = self.column_mapping, other.column_mapping
+        # rename maps each label independently, so composing the two label
+        # functions matches sequential execution even when labels collide
+        mapping = {old: second.get(new, new) for old, new in first.items()}
+        mapping.update((old, new) for old, new in second.items() if old not in first)
+        mapping = {old: new for old, new in mapping.items() if old != new}
+        if not mapping:
+            # The renames cancel out; an empty ColumnRenamer is not valid
+            return None
+        return ColumnRenamer(mapping)
+
     def _validate_mapping(self):
         if not isinstance(self.column_mapping, dict):
             raise TypeError("Column mapping must be a dictionary")
@@ -1,2 +1,10 @@
 from .unit.test_column_renamer import *
 from .unit.connectors.sinks.database.test_sql_sink import *
+from .unit.connectors.sources.file_based.test_csv_source import *
+from .unit.core.optimizers.test_strategies import *
+from .unit.core.pipeline.test_pipeline import *
+from .unit.core.optimizers.test_cayley import *
+from .unit.connectors.sinks.stdout.test_print_sink import *
+from .unit.core.pipeline.test_caching_pipeline import *
+from .unit.core.pipeline.test_optimizing_builder import *
+from .unit.orm.test_base import *
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy import Column, Float, Integer, String, create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from arcaneflow.connectors.sinks.database.sql_sink import SQLAlchemySink
@@ -57,3 +57,70 @@ def test_full_pipeline(test_db, tmp_path):
         inserted_rows = session.query(TestModel).count()
         assert inserted_rows == 3, "Should insert 3 rows from CSV"
         assert result.metadata["processed_rows"] == 3, "Should process 3 rows"
+
+
+def test_chunked_pipeline(test_db, tmp_path):
+    """Test a chunked CSV source streams every chunk through to the DB sink."""
+    engine, Session = test_db
+
+    Base = declarative_base()
+
+    class TestModel(Base):
+        __tablename__ = "test_table"
+        id = Column(Integer, primary_key=True)
+        new_col = Column(String)
+
+    Base.metadata.create_all(engine)
+
+    csv_path = tmp_path / "test.csv"
+    csv_path.write_text("old_col\n" + "".join(f"value{i}\n" for i in range(5)))
+
+    pipeline = (
+        PipelineBuilder()
+        .set_source(CSVSource(str(csv_path), chunksize=2))
+        .add_node(ColumnRenamer({"old_col": "new_col"}))
+        .set_sink(SQLAlchemySink(TestModel))
+        .build()
+    )
+
+    with Session() as session:
+        result = pipeline.execute(session=session)
+        session.commit()
+
+        assert session.query(TestModel).count() == 5
+        assert result.metadata["processed_rows"] == 5
+
+
+def test_missing_values_are_stored_as_null(test_db, tmp_path):
+    """Test empty CSV cells reach the database as NULL rather than failing."""
+    engine, Session = test_db
+
+    Base = declarative_base()
+
+    class TestModel(Base):
+        __tablename__ = "test_table"
+        id = Column(Integer, primary_key=True)
+        count = Column(Integer)
+        score = Column(Float)
+        label = Column(String)
+
+    Base.metadata.create_all(engine)
+
+    csv_path = tmp_path / "test.csv"
+    csv_path.write_text("id,count,score,label\n1,,1.5,a\n2,3,,\n")
+
+    pipeline = (
+        PipelineBuilder()
+        .set_source(CSVSource(str(csv_path)))
+        .set_sink(SQLAlchemySink(TestModel))
+        .build()
+    )
+
+    with Session() as session:
+        pipeline.execute(session=session)
+        session.commit()
+
+        rows = session.query(
+            TestModel.id, TestModel.count, TestModel.score, TestModel.label
+        ).order_by(TestModel.id)
+        assert [tuple(row) for row in rows] == [(1, None, 1.5, "a"), (2, 3, None, None)]
@@ -1,17 +1,48 @@
+import csv
+import io
+
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, call
 import pandas as pd
-from typing import Type
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import declarative_base
 
 # Import the classes to be tested
+from arcaneflow.connectors.sinks.database import sql_sink
 from arcaneflow.connectors.sinks.database.sql_sink import SQLAlchemySink
 from arcaneflow.core.interfaces.context import PipelineContext
 
+Base = declarative_base()
+
 
-# Mock model class for testing
-class MockModel(DeclarativeMeta):
+# Minimal mapped model for testing
+class MockModel(Base):
     __tablename__ = "test_table"
+    id = Column(Integer, primary_key=True)
+
+
+class NullableModel(Base):
+    __tablename__ = "nullable_table"
+    id = Column(Integer, primary_key=True)
+    count = Column(Integer)
+    score = Column(Float)
+    label = Column(String)
+
+
+class KeyedModel(Base):
+    __tablename__ = "keyed_table"
+    id = Column(Integer, primary_key=True)
+    note = Column("note_text", String, key="note")
+
+
+def _read_copy_payload(payload):
+    """Parse a COPY payload the way PostgreSQL does with FORCE_NULL on all columns."""
+    return [
+        [None if field == "\\N" else field for field in row]
+        for row in csv.reader(io.StringIO(payload))
+    ]
 
 
 def test_node_id_property():
@@ -49,13 +80,16 @@ def test_execute_processes_batches_correctly():
     result_context = sink.execute(context)
 
     # Verify batch processing
-    calls = mock_session.bulk_insert_mappings.call_args_list
+    calls = mock_session.execute.call_args_list
     assert len(calls) == 3  # 2500 / 1000 = 3 batches
 
     # Check batch sizes
     assert len(calls[0][0][1]) == batch_size  # First batch
     assert len(calls[1][0][1]) == batch_size  # Second batch
     assert len(calls[2][0][1]) == total_rows % batch_size  # Third batch (500)
+    assert calls[0][0][1][0] == {"id": 0}
+    # Every batch reuses the statement built at construction
+    assert {id(c[0][0]) for c in calls} == {id(sink._insert_stmt)}
 
     # Verify metadata
     assert result_context.metadata["processed_rows"] == total_rows
@@ -73,7 +107,7 @@ def test_execute_with_empty_data():
     result_context = sink.execute(context)
 
     # Verify no insertion attempted
-    mock_session.bulk_insert_mappings.assert_not_called()
+    mock_session.execute.assert_not_called()
     assert result_context.metadata["processed_rows"] == 0
 
 
@@ -91,7 +125,218 @@ def test_execute_with_smaller_than_batch_data():
     sink.execute(context)
 
     # Verify single batch insertion
-    mock_session.bulk_insert_mappings.assert_called_once()
-    call_args = mock_session.bulk_insert_mappings.call_args
+    mock_session.execute.assert_called_once()
+    call_args = mock_session.execute.call_args
     assert len(call_args[0][1]) == total_rows
     assert context.metadata["processed_rows"] == total_rows
+
+
+@pytest.mark.parametrize("driver", ["psycopg2", "psycopg"])
+def test_execute_uses_copy_on_postgresql(driver, monkeypatch):
+    """Test PostgreSQL sessions load each batch with COPY instead of INSERT."""
+    monkeypatch.setattr(sql_sink, "_COPY_MIN_ROWS", 0)
+    sink = SQLAlchemySink(model=MockModel, batch_size=2)
+    mock_session = MagicMock()
+    dialect = postgresql.dialect()
+    dialect.driver = driver
+    mock_session.get_bind.return_value.dialect = dialect
+    cursor = mock_session.connection.return_value.connection.cursor.return_value
+
+    context = PipelineContext(data=pd.DataFrame({"id": [1, 2, 3]}))
+    context._session = mock_session
+
+    sink.execute(context)
+
+    mock_session.execute.assert_not_called()
+    expected_sql = (
+        "COPY test_table (id) FROM STDIN WITH "
+        "(FORMAT csv, NULL '\\N', FORCE_NULL (id))"
+    )
+    if driver == "psycopg2":
+        payloads = [c.args[1].getvalue() for c in cursor.copy_expert.call_args_list]
+        assert {c.args[0] for c in cursor.copy_expert.call_args_list} == {expected_sql}
+    else:
+        copy = cursor.copy.return_value.__enter__.return_value
+        payloads = [c.args[0] for c in copy.write.call_args_list]
+        assert {c.args[0] for c in cursor.copy.call_args_list} == {expected_sql}
+    assert payloads == ["1\n2\n", "3\n"]
+    cursor.close.assert_called_once()
+    assert context.metadata["processed_rows"] == 3
+
+
+def test_execute_inserts_small_frames_on_postgresql():
+    """Test frames under the COPY threshold still use a plain INSERT."""
+    sink = SQLAlchemySink(model=MockModel, batch_size=2)
+    mock_session = MagicMock()
+    dialect = postgresql.dialect()
+    dialect.driver = "psycopg2"
+    mock_session.get_bind.return_value.dialect = dialect
+
+    context = PipelineContext(data=pd.DataFrame({"id": [1, 2, 3]}))
+    context._session = mock_session
+
+    sink.execute(context)
+
+    assert mock_session.execute.call_count == 2
+    mock_session.connection.assert_not_called()
+    assert context.metadata["processed_rows"] == 3
+
+
+@pytest.mark.parametrize(
+    "rows, uses_copy",
+    [(sql_sink._COPY_MIN_ROWS, False), (sql_sink._COPY_MIN_ROWS + 1, True)],
+)
+def test_non_model_columns_are_ignored_on_both_sides_of_threshold(rows, uses_copy):
+    """Test a frame with an extra column loads only model columns on either path."""
+    sink = SQLAlchemySink(model=MockModel, batch_size=1000)
+    mock_session = MagicMock()
+    dialect = postgresql.dialect()
+    dialect.driver = "psycopg2"
+    mock_session.get_bind.return_value.dialect = dialect
+    cursor = mock_session.connection.return_value.connection.cursor.return_value
+
+    frame = pd.DataFrame({"id": range(rows), "extra": "x"})
+    context = PipelineContext(data=frame)
+    context._session = mock_session
+
+    sink.execute(context)
+
+    if uses_copy:
+        mock_session.execute.assert_not_called()
+        sql, payload = cursor.copy_expert.call_args.args
+        assert "extra" not in sql
+        assert _read_copy_payload(payload.getvalue())[0] == ["0"]
+    else:
+        cursor.copy_expert.assert_not_called()
+        statement, batch = mock_session.execute.call_args.args
+        compiled = statement.compile(dialect=dialect, column_keys=list(batch[0]))
+        assert str(compiled).startswith("INSERT INTO test_table (id) VALUES")
+    assert context.metadata["processed_rows"] == rows
+
+
+@pytest.mark.parametrize(
+    "frame, expected",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "id": [1, 2],
+                    "count": [3.0, np.nan],
+                    "score": [np.nan, 2.5],
+                    "label": ["", None],
+                }
+            ),
+            [["1", "3", None, ""], ["2", None, "2.5", None]],
+        ),
+        (pd.DataFrame({"score": [np.nan, 1.5]}), [[None], ["1.5"]]),
+        (pd.DataFrame({"label": ["", None]}), [[""], [None]]),
+        (pd.DataFrame({"count": [1.5, np.nan]}), [["1.5"], [None]]),
+    ],
+)
+def test_copy_payload_keeps_nulls_empty_strings_and_ints(frame, expected):
+    """Test COPY payloads mark NULLs explicitly and keep integers integral."""
+    sink = SQLAlchemySink(model=NullableModel)
+
+    payload = sink._copy_payload(frame)
+
+    assert _read_copy_payload(payload) == expected
+
+
+def test_copy_payload_quotes_empty_strings():
+    """Test empty strings are quoted so they never read as NULL."""
+    sink = SQLAlchemySink(model=NullableModel)
+
+    payload = sink._copy_payload(pd.DataFrame({"id": [1, 2], "label": ["", None]}))
+
+    assert payload == '1,""\n2,"\\N"\n'
+
+
+def _typed(row, columns):
+    """Coerce numbers to int when whole and float otherwise, keeping None and text."""
+    table = NullableModel.__table__.columns
+    typed = []
+    for name, value in zip(columns, row):
+        if value is None or table[name].type.python_type is str:
+            typed.append(value)
+        else:
+            number = float(value)
+            typed.append(int(number) if number.is_integer() else number)
+    return tuple(typed)
+
+
+def test_copy_names_model_columns_and_skips_others():
+    """Test COPY binds frame columns by key, names them by column name, and drops extras."""
+    sink = SQLAlchemySink(model=KeyedModel)
+    session = MagicMock()
+    dialect = postgresql.dialect()
+    dialect.driver = "psycopg2"
+    session.get_bind.return_value.dialect = dialect
+    cursor = session.connection.return_value.connection.cursor.return_value
+
+    frame = pd.DataFrame({"extra": [0, 0], "note": ["a", "b"], "id": [1, 2]})
+    sink._copy(session, frame)
+
+    sql, payload = cursor.copy_expert.call_args.args
+    assert sql.startswith("COPY keyed_table (id, note_text) FROM STDIN")
+    assert "extra" not in sql
+    assert _read_copy_payload(payload.getvalue()) == [["1", "a"], ["2", "b"]]
+
+
+@pytest.mark.parametrize("driver", ["psycopg2", "psycopg"])
+def test_copy_and_insert_paths_write_the_same_rows(driver, monkeypatch):
+    """Test a frame loads the same values whichever side of the threshold it is."""
+    frame = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "count": [3.0, np.nan, 5.0],
+            "score": [np.nan, 2.5, 0.0],
+            "label": ["", None, "x"],
+            "extra": ["not", "a", "column"],
+        }
+    )
+    # A non-integral float in an integer column is passed through by INSERT
+    fractional = frame.assign(count=[1.5, np.nan, 5.0])
+    columns = ["id", "count", "score", "label"]
+    dialect = postgresql.dialect()
+    dialect.driver = driver
+
+    def run(data, copy_min_rows):
+        monkeypatch.setattr(sql_sink, "_COPY_MIN_ROWS", copy_min_rows)
+        session = MagicMock()
+        session.get_bind.return_value.dialect = dialect
+        context = PipelineContext(data=data)
+        context._session = session
+        SQLAlchemySink(model=NullableModel, batch_size=2).execute(context)
+        return session
+
+    def load(data):
+        inserted = [
+            _typed([record[name] for name in columns], columns)
+            for c in run(data, copy_min_rows=len(data)).execute.call_args_list
+            for record in c.args[1]
+        ]
+
+        cursor = run(data, copy_min_rows=0).connection.return_value.connection.cursor
+        if driver == "psycopg2":
+            calls = cursor.return_value.copy_expert.call_args_list
+            payloads = [c.args[1].getvalue() for c in calls]
+            statements = [c.args[0] for c in calls]
+        else:
+            copy = cursor.return_value.copy.return_value.__enter__.return_value
+            payloads = [c.args[0] for c in copy.write.call_args_list]
+            statements = [c.args[0] for c in cursor.return_value.copy.call_args_list]
+        assert all("extra" not in statement for statement in statements)
+        copied = [
+            _typed(row, columns)
+            for payload in payloads
+            for row in _read_copy_payload(payload)
+        ]
+        assert copied == inserted
+        return copied
+
+    assert load(frame) == [(1, 3, None, ""), (2, None, 2.5, None), (3, 5, 0, "x")]
+    assert load(fractional) == [
+        (1, 1.5, None, ""),
+        (2, None, 2.5, None),
+        (3, 5, 0, "x"),
+    ]
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from arcaneflow.connectors.sinks.stdout.print_sink import PrintSink
+from arcaneflow.core.interfaces.context import PipelineContext
+
+
+def test_execute_prints_limited_rows(capsys):
+    """Test only the first `limit` rows are printed and counted."""
+    context = PipelineContext(data=pd.DataFrame({"value": range(10)}))
+
+    result = PrintSink(limit=3).execute(context)
+
+    assert "10 total rows" in capsys.readouterr().out
+    assert result.metadata == {"printed_rows": 3, "total_rows": 10}
+
+
+@pytest.mark.parametrize("limit", [0, None])
+def test_disabled_sink_is_a_pass_through(capsys, limit):
+    """Test a disabled sink prints nothing and leaves metadata untouched."""
+    context = PipelineContext(data=pd.DataFrame({"value": range(10)}))
+
+    result = PrintSink(limit=limit).execute(context)
+
+    assert capsys.readouterr().out == ""
+    assert result.metadata == {}
+
+
+def test_non_dataframe_data_is_printed_as_repr(capsys):
+    """Test data without a DataFrame API is printed via repr and not counted."""
+    context = PipelineContext(data=[1, 2, 3])
+
+    result = PrintSink(limit=2).execute(context)
+
+    assert "[1, 2, 3]" in capsys.readouterr().out
+    assert result.metadata == {}
@@ -0,0 +1,173 @@
+import pandas as pd
+import pyarrow.csv as pacsv
+import pytest
+
+from arcaneflow.connectors.sources.file_based.csv_source import CSVSource
+from arcaneflow.core.interfaces.context import PipelineContext
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "cities.csv"
+    path.write_text("name,population\nOslo,700000\nBergen,290000\n")
+    return str(path)
+
+
+def test_execute_defaults_to_arrow_backed_frame(csv_path):
+    """Test the default engine yields Arrow extension dtypes."""
+    context = CSVSource(csv_path).execute(PipelineContext())
+
+    assert list(context.data.columns) == ["name", "population"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in context.data.dtypes)
+    assert context.data["population"].tolist() == [700000, 290000]
+    assert context.metadata["source"] == csv_path
+
+
+def test_execute_with_c_engine_uses_numpy_dtypes(csv_path):
+    """Test the pandas C parser fallback keeps NumPy dtypes."""
+    context = CSVSource(csv_path, engine="c").execute(PipelineContext())
+
+    assert context.data["population"].dtype == "int64"
+
+
+def test_unknown_engine_raises():
+    """Test constructing a source with an unsupported engine fails early."""
+    with pytest.raises(ValueError, match="Unsupported CSV engine"):
+        CSVSource("data.csv", engine="python")
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_execute_with_chunksize_yields_row_bounded_chunks(tmp_path, engine):
+    """Test chunked reads hand out an iterator of frames of at most chunksize rows."""
+    path = tmp_path / "numbers.csv"
+    path.write_text("n\n" + "".join(f"{i}\n" for i in range(5)))
+
+    context = CSVSource(str(path), engine=engine, chunksize=2).execute(
+        PipelineContext()
+    )
+    chunks = list(context.data)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks)["n"].tolist() == list(range(5))
+
+
+def test_pandas_kwargs_fall_back_to_c_engine(tmp_path):
+    """Test pandas-only read_csv arguments keep working on the default engine."""
+    path = tmp_path / "cities.csv"
+    path.write_text("name;population\nOslo;700000\nBergen;290000\n")
+
+    source = CSVSource(str(path), sep=";", usecols=["population"])
+    context = source.execute(PipelineContext())
+
+    assert source.engine == "c"
+    assert context.data["population"].tolist() == [700000, 290000]
+
+
+def test_whitespace_only_lines_are_skipped(tmp_path):
+    """Test whitespace-only lines are dropped like pd.read_csv does."""
+    single = tmp_path / "single.csv"
+    single.write_text("n\n1\n   \n3\n  ")
+    multi = tmp_path / "multi.csv"
+    multi.write_text("a,b\n1,2\n   \n3,4\n")
+
+    single_data = CSVSource(str(single)).execute(PipelineContext()).data
+    multi_data = CSVSource(str(multi)).execute(PipelineContext()).data
+
+    assert single_data["n"].tolist() == [1, 3]
+    assert multi_data.to_dict("list") == {"a": [1, 3], "b": [2, 4]}
+
+
+@pytest.mark.parametrize("delimiter", [",", ";"])
+def test_chunked_read_survives_type_change_after_first_block(tmp_path, delimiter):
+    """Test a column turning to text past the first Arrow block still reads."""
+    path = tmp_path / "codes.csv"
+    rows = [f"{i}{delimiter}{i}" for i in range(200)] + [f"200{delimiter}x"]
+    path.write_text(f"id{delimiter}code\n" + "\n".join(rows) + "\n")
+
+    source = CSVSource(
+        str(path),
+        chunksize=50,
+        read_options=pacsv.ReadOptions(block_size=256),
+        parse_options=pacsv.ParseOptions(delimiter=delimiter),
+    )
+    data = pd.concat(source.execute(PipelineContext()).data)
+
+    assert data["id"].tolist() == list(range(201))
+    assert [str(code) for code in data["code"]] == [str(i) for i in range(200)] + ["x"]
+
+
+def _type_change_csv(tmp_path, lines=None):
+    """Write a CSV whose ``code`` column turns to text past the first block."""
+    path = tmp_path / "codes.csv"
+    rows = [f"{i},{i},{i}" for i in range(200)] + ["200,x,NA"]
+    path.write_text("\n".join((lines or []) + ["id,code,extra"] + rows) + "\n")
+    return str(path)
+
+
+def _read_chunks(path, **kwargs):
+    source = CSVSource(
+        path, chunksize=50, read_options=pacsv.ReadOptions(block_size=256), **kwargs
+    )
+    return list(source.execute(PipelineContext()).data)
+
+
+def test_type_change_fallback_keeps_arrow_dtypes(tmp_path):
+    """Test chunks read after the pandas fallback stay Arrow-backed."""
+    chunks = _read_chunks(_type_change_csv(tmp_path))
+
+    assert all(
+        isinstance(dtype, pd.ArrowDtype) for chunk in chunks for dtype in chunk.dtypes
+    )
+    assert [chunk.index[0] for chunk in chunks] == [0] * len(chunks)
+
+
+def test_type_change_fallback_honours_convert_options(tmp_path):
+    """Test include_columns and null_values carry over to the pandas fallback."""
+    chunks = _read_chunks(
+        _type_change_csv(tmp_path),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=["code", "id"], null_values=["0"]
+        ),
+    )
+    data = pd.concat(chunks)
+
+    assert {tuple(chunk.columns) for chunk in chunks} == {("code", "id")}
+    assert data["id"].isna().tolist() == [True] + [False] * 200
+    assert data["code"].iloc[-1] == "x"
+
+
+def test_type_change_fallback_honours_read_options(tmp_path):
+    """Test skip_rows and column_names carry over to the pandas fallback."""
+    path = _type_change_csv(tmp_path, lines=["# exported"])
+    source = CSVSource(
+        path,
+        chunksize=50,
+        read_options=pacsv.ReadOptions(
+            block_size=256, skip_rows=2, column_names=["a", "b", "c"]
+        ),
+    )
+    chunks = list(source.execute(PipelineContext()).data)
+    data = pd.concat(chunks)
+
+    assert {tuple(chunk.columns) for chunk in chunks} == {("a", "b", "c")}
+    assert data["a"].tolist() == list(range(201))
+
+
+def test_type_change_with_untranslatable_options_raises(tmp_path):
+    """Test options pandas cannot honour fail clearly instead of being dropped."""
+    source = CSVSource(
+        _type_change_csv(tmp_path),
+        chunksize=50,
+        read_options=pacsv.ReadOptions(block_size=256, skip_rows_after_names=1),
+    )
+
+    with pytest.raises(ValueError, match="skip_rows_after_names"):
+        list(source.execute(PipelineContext()).data)
+
+
+def test_chunked_header_only_file_yields_no_chunks(tmp_path):
+    """Test a header-only file streams no chunks rather than empty ones."""
+    path = tmp_path / "empty.csv"
+    path.write_text("a,b\n")
+
+    assert _read_chunks(str(path)) == []
@@ -0,0 +1,69 @@
+import pytest
+
+from arcaneflow.connectors.sinks.stdout.print_sink import PrintSink
+from arcaneflow.core.optimizers.cayley import CayleyGraphOptimizer
+from arcaneflow.core.optimizers.graph.schema_state_manager import SchemaStateManager
+from arcaneflow.core.pipeline.builder import Pipeline
+from arcaneflow.transformations.column_operations.rename import ColumnRenamer
+
+
+def test_optimize_pipeline_drops_renames_that_cycle_back():
+    """Test renames returning to an earlier schema state are removed."""
+    keep = ColumnRenamer({"a": "b"})
+    pipeline = Pipeline(
+        PrintSink(),
+        [keep, ColumnRenamer({"b": "c"}), ColumnRenamer({"c": "b"})],
+        None,
+    )
+
+    optimized = CayleyGraphOptimizer().optimize_pipeline(pipeline)
+
+    assert optimized.nodes == [keep]
+
+
+def test_optimize_pipeline_keeps_linear_pipeline():
+    """Test a pipeline without redundant transformations is returned as-is."""
+    pipeline = Pipeline(
+        PrintSink(), [ColumnRenamer({"a": "b"}), ColumnRenamer({"b": "c"})], None
+    )
+
+    assert CayleyGraphOptimizer().optimize_pipeline(pipeline) is pipeline
+
+
+def test_repeated_optimization_does_not_accumulate_schema_state():
+    """Test reusing one optimizer keeps only the latest pipeline's schemas."""
+    optimizer = CayleyGraphOptimizer()
+    for column in ("a", "b", "c"):
+        optimizer.optimize_pipeline(
+            Pipeline(PrintSink(), [ColumnRenamer({column: column * 2})], None)
+        )
+
+    assert optimizer.schema_manager.schema_to_node_name == {}
+
+
+def test_graph_reuses_node_for_equal_schemas():
+    """Test a schema reached twice maps to one graph node."""
+    pipeline = Pipeline(
+        PrintSink(),
+        [
+            ColumnRenamer({"a": "b"}),
+            ColumnRenamer({"b": "c"}),
+            ColumnRenamer({"c": "b"}),
+        ],
+        None,
+    )
+
+    graph = CayleyGraphOptimizer().graph_builder.build_graph(pipeline)
+
+    assert graph.edges_dst[0] == graph.edges_dst[-1]
+    assert len(graph.node_schemas) == len(set(graph.node_schemas))
+
+
+def test_get_or_create_node_is_deprecated():
+    """Test the legacy node-name API still works but warns."""
+    manager = SchemaStateManager()
+
+    with pytest.warns(DeprecationWarning):
+        name = manager.get_or_create_node(frozenset({"a"}))
+
+    assert name == f"schema_{hash(frozenset({'a'}))}"
@@ -0,0 +1,55 @@
+from arcaneflow.core.optimizers.graph.transformation_graph import TransformationGraph
+from arcaneflow.core.optimizers.strategies import CycleOptimizer, RedundancyOptimizer
+
+
+def _graph(edges):
+    """Build a schema graph from (source, target, node_id) triples."""
+    graph = TransformationGraph()
+    for source, target, node_id in edges:
+        graph.add_edge(
+            graph.add_node(frozenset(source)),
+            graph.add_node(frozenset(target)),
+            node_id,
+            None,
+        )
+    return graph
+
+
+def test_cycle_optimizer_ignores_acyclic_graph():
+    """Test a linear chain of schema states has no cyclical redundancy."""
+    graph = _graph([("a", "b", "n1"), ("b", "c", "n2")])
+
+    assert CycleOptimizer().identify_redundancies(graph) == set()
+
+
+def test_cycle_optimizer_flags_every_edge_on_a_cycle():
+    """Test edges inside a cycle are flagged while edges leading into it are not."""
+    graph = _graph(
+        [("a", "b", "n1"), ("b", "c", "n2"), ("c", "d", "n3"), ("d", "b", "n4")]
+    )
+
+    assert CycleOptimizer().identify_redundancies(graph) == {"n2", "n3", "n4"}
+
+
+def test_cycle_optimizer_flags_self_loops():
+    """Test a transformation that leaves the schema unchanged is flagged."""
+    graph = _graph([("a", "b", "n1"), ("b", "b", "n2")])
+
+    assert CycleOptimizer().identify_redundancies(graph) == {"n2"}
+
+
+def test_redundancy_optimizer_flags_schema_preserving_edges():
+    """Test only edges between identical schemas are reported."""
+    graph = _graph([("a", "b", "n1"), ("b", "b", "n2")])
+
+    assert RedundancyOptimizer().identify_redundancies(graph) == {"n2"}
+
+
+def test_to_networkx_preserves_nodes_and_edges():
+    """Test the networkx adapter mirrors the edge arrays."""
+    graph = _graph([("a", "b", "n1"), ("b", "c", "n2")])
+
+    digraph = graph.to_networkx()
+
+    assert digraph.nodes["schema_1"]["schema"] == frozenset("b")
+    assert digraph.edges["schema_1", "schema_2"]["node_id"] == "n2"
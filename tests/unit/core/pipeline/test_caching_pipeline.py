@@ -0,0 +1,147 @@
+import pandas as pd
+
+from arcaneflow.core.interfaces.context import PipelineContext
+from arcaneflow.core.interfaces.etl_node import ETLNode
+from arcaneflow.core.pipeline.caching_pipeline import CachingPipeline
+
+
+class FrameSource(ETLNode):
+    """Source re-emitting a copy of a fixed frame on every run."""
+
+    def __init__(self, df):
+        self.df = df
+
+    @property
+    def node_id(self) -> str:
+        return "FrameSource"
+
+    def execute(self, context: PipelineContext) -> PipelineContext:
+        context.data = self.df.copy()
+        return context
+
+
+class CountingDoubler(ETLNode):
+    """Transformation multiplying every value and counting its invocations."""
+
+    def __init__(self, cacheable=True, factor=2):
+        self._calls = 0
+        self.cacheable = cacheable
+        self.factor = factor
+
+    @property
+    def calls(self) -> int:
+        return self._calls
+
+    @property
+    def node_id(self) -> str:
+        return "CountingDoubler"
+
+    def execute(self, context: PipelineContext) -> PipelineContext:
+        self._calls += 1
+        context.data = context.data * self.factor
+        context.metadata["doubled"] = True
+        return context
+
+
+def test_rerun_on_same_data_hits_cache():
+    """Test a second run replays the cached result and metadata."""
+    node = CountingDoubler()
+    pipeline = CachingPipeline(FrameSource(pd.DataFrame({"v": [1, 2]})), [node], None)
+
+    pipeline.execute()
+    result = pipeline.execute()
+
+    assert node.calls == 1
+    assert result.data["v"].tolist() == [2, 4]
+    assert result.metadata["doubled"] is True
+
+
+def test_changed_data_misses_cache():
+    """Test different input values or column labels run the node again."""
+    node = CountingDoubler()
+    source = FrameSource(pd.DataFrame({"v": [1, 2]}))
+    pipeline = CachingPipeline(source, [node], None)
+
+    pipeline.execute()
+    source.df = pd.DataFrame({"v": [1, 3]})
+    pipeline.execute()
+    source.df = pd.DataFrame({"w": [1, 3]})
+    pipeline.execute()
+
+    assert node.calls == 3
+
+
+def test_non_cacheable_node_always_runs():
+    """Test nodes opting out of caching execute on every run."""
+    node = CountingDoubler(cacheable=False)
+    pipeline = CachingPipeline(FrameSource(pd.DataFrame({"v": [1]})), [node], None)
+
+    pipeline.execute()
+    pipeline.execute()
+
+    assert node.calls == 2
+
+
+def test_nodes_are_not_cached_unless_they_opt_in():
+    """Test nodes without a cacheable declaration run on every execution."""
+
+    class Recorder(ETLNode):
+        calls = 0
+
+        @property
+        def node_id(self) -> str:
+            return "Recorder"
+
+        def execute(self, context: PipelineContext) -> PipelineContext:
+            Recorder.calls += 1
+            return context
+
+    pipeline = CachingPipeline(
+        FrameSource(pd.DataFrame({"v": [1]})), [Recorder()], None
+    )
+
+    pipeline.execute()
+    pipeline.execute()
+
+    assert Recorder.calls == 2
+
+
+def test_unhashable_frames_are_not_cached():
+    """Test frames holding lists run the node instead of failing to hash."""
+    node = CountingDoubler(factor=1)
+    pipeline = CachingPipeline(
+        FrameSource(pd.DataFrame({"v": [[1, 2], [3]]})), [node], None
+    )
+
+    pipeline.execute()
+    result = pipeline.execute()
+
+    assert node.calls == 2
+    assert result.data["v"].tolist() == [[1, 2], [3]]
+
+
+def test_node_configuration_is_part_of_the_key():
+    """Test nodes sharing a node_id but configured differently are not mixed up."""
+    source = FrameSource(pd.DataFrame({"v": [1]}))
+    pipeline = CachingPipeline(source, [CountingDoubler(factor=2)], None)
+    pipeline.execute()
+
+    pipeline.nodes = [CountingDoubler(factor=3)]
+    result = pipeline.execute()
+
+    assert result.data["v"].tolist() == [3]
+
+
+def test_cache_evicts_least_recently_used_results():
+    """Test the cache never holds more than max_entries results."""
+    node = CountingDoubler()
+    source = FrameSource(pd.DataFrame({"v": [0]}))
+    pipeline = CachingPipeline(source, [node], None, max_entries=2)
+
+    for value in (1, 2, 1, 3, 1, 2):
+        source.df = pd.DataFrame({"v": [value]})
+        pipeline.execute()
+
+    assert len(pipeline._cache) == 2
+    # 1 stays cached as the most recently used; 2 was evicted by 3
+    assert node.calls == 4
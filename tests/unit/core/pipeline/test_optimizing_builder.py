@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from arcaneflow.connectors.sinks.stdout.print_sink import PrintSink
+from arcaneflow.core.pipeline.optimizing_builder import OptimizingPipelineBuilder
+from arcaneflow.transformations.column_operations.rename import ColumnRenamer
+
+
+def _builder():
+    return (
+        OptimizingPipelineBuilder()
+        .set_source(PrintSink())
+        .add_node(ColumnRenamer({"a": "b"}))
+        .add_node(ColumnRenamer({"b": "c"}))
+        .add_node(ColumnRenamer({"c": "b"}))
+    )
+
+
+def test_build_optimizes_without_touching_builder():
+    """Test the built pipeline is optimized while the builder keeps its nodes."""
+    builder = _builder()
+
+    pipeline = builder.build()
+
+    assert [node.column_mapping for node in pipeline.nodes] == [{"a": "b", "c": "b"}]
+    assert len(builder.nodes) == 3
+
+
+def test_build_with_optimization_disabled_keeps_all_nodes():
+    """Test disabling optimization returns the nodes as configured."""
+    pipeline = _builder().disable_optimization().build()
+
+    assert len(pipeline.nodes) == 3
+
+
+def test_build_fuses_adjacent_renames():
+    """Test consecutive column renames collapse into a single node."""
+    builder = (
+        OptimizingPipelineBuilder()
+        .set_source(PrintSink())
+        .add_node(ColumnRenamer({"a": "b"}))
+        .add_node(ColumnRenamer({"b": "c"}))
+    )
+
+    pipeline = builder.build()
+
+    assert [node.column_mapping for node in pipeline.nodes] == [{"a": "c", "b": "c"}]
+    assert len(builder.nodes) == 2
+
+
+def test_concurrent_builds_are_independent():
+    """Test builds running on several threads each get the right pipeline."""
+    builders = [_builder() for _ in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pipelines = list(pool.map(OptimizingPipelineBuilder.build, builders))
+
+    assert all(
+        [node.column_mapping for node in pipeline.nodes] == [{"a": "b", "c": "b"}]
+        for pipeline in pipelines
+    )
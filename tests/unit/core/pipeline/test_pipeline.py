@@ -0,0 +1,146 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from arcaneflow.core.interfaces.context import PipelineContext
+from arcaneflow.core.interfaces.etl_node import ETLNode
+from arcaneflow.core.pipeline.builder import PipelineBuilder
+from arcaneflow.transformations.column_operations.rename import ColumnRenamer
+
+
+class ChunkedSource(ETLNode):
+    """Source handing out a generator of small frames, optionally failing."""
+
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    @property
+    def node_id(self) -> str:
+        return "ChunkedSource"
+
+    def execute(self, context: PipelineContext) -> PipelineContext:
+        context.data = self._generate()
+        return context
+
+    def _generate(self):
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                raise RuntimeError("source failed")
+            yield chunk
+
+
+class RecordingSink(ETLNode):
+    """Sink remembering every frame it receives."""
+
+    def __init__(self, fail=False):
+        self.received = []
+        self.fail = fail
+
+    @property
+    def node_id(self) -> str:
+        return "RecordingSink"
+
+    def execute(self, context: PipelineContext) -> PipelineContext:
+        if self.fail:
+            raise RuntimeError("sink failed")
+        self.received.append(context.data)
+        context.metadata["processed_rows"] = len(context.data)
+        return context
+
+
+def _chunks(count, size=2):
+    return [pd.DataFrame({"n": range(i * size, (i + 1) * size)}) for i in range(count)]
+
+
+def test_streaming_runs_sink_per_chunk_in_order():
+    """Test every chunk reaches the sink in order and row counts are summed."""
+    sink = RecordingSink()
+    pipeline = PipelineBuilder().set_source(ChunkedSource(_chunks(5))).set_sink(sink)
+
+    result = pipeline.build().execute()
+
+    assert [frame["n"].iloc[0] for frame in sink.received] == [0, 2, 4, 6, 8]
+    assert result.metadata["processed_rows"] == 10
+
+
+def test_streaming_empty_source_yields_empty_frame():
+    """Test a chunked source producing no chunks ends with an empty frame."""
+    sink = RecordingSink()
+    pipeline = PipelineBuilder().set_source(ChunkedSource([])).set_sink(sink)
+
+    result = pipeline.build().execute()
+
+    assert sink.received == []
+    assert isinstance(result.data, pd.DataFrame) and result.data.empty
+    assert result.metadata["processed_rows"] == 0
+
+
+def test_streaming_propagates_source_errors():
+    """Test an exception raised while reading chunks surfaces from execute."""
+    pipeline = (
+        PipelineBuilder()
+        .set_source(ChunkedSource(_chunks(5), fail_after=3))
+        .set_sink(RecordingSink())
+        .build()
+    )
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        pipeline.execute()
+
+
+def test_streaming_sink_error_does_not_block_on_full_buffer():
+    """Test a failing sink stops the read-ahead thread instead of hanging."""
+    pipeline = (
+        PipelineBuilder()
+        .set_source(ChunkedSource(_chunks(50)))
+        .set_sink(RecordingSink(fail=True))
+        .build()
+    )
+
+    with pytest.raises(RuntimeError, match="sink failed"):
+        pipeline.execute()
+
+
+def test_build_keeps_nodes_as_configured():
+    """Test the plain builder leaves fusion to the optimizing builder."""
+    builder = (
+        PipelineBuilder()
+        .set_source(ChunkedSource([]))
+        .add_node(ColumnRenamer({"a": "b"}))
+        .add_node(ColumnRenamer({"b": "c"}))
+    )
+
+    pipeline = builder.build()
+
+    assert [node.column_mapping for node in pipeline.nodes] == [
+        {"a": "b"},
+        {"b": "c"},
+    ]
+
+
+def test_execute_rolls_back_session_on_error():
+    """Test a failing run rolls back and detaches the session."""
+    session = MagicMock()
+    pipeline = (
+        PipelineBuilder()
+        .set_source(ChunkedSource(_chunks(1)))
+        .set_sink(RecordingSink(fail=True))
+        .build()
+    )
+
+    with pytest.raises(RuntimeError, match="sink failed"):
+        pipeline.execute(session=session)
+
+    session.rollback.assert_called_once()
+
+
+def test_execute_without_session_does_not_bind_one():
+    """Test a run without a session leaves the context unbound."""
+    pipeline = PipelineBuilder().set_source(ChunkedSource(_chunks(1))).build()
+
+    context = pipeline.execute()
+
+    with pytest.raises(ValueError):
+        context.session
@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+
+from arcaneflow.orm.base import SQLAManager
+
+
+def test_engine_uses_insertmanyvalues_page_size():
+    """Test the page size is forwarded to the engine's dialect."""
+    manager = SQLAManager("sqlite://", insertmanyvalues_page_size=250)
+
+    assert manager.engine.dialect.insertmanyvalues_page_size == 250
+
+
+def test_psycopg2_engine_batches_executemany():
+    """Test psycopg2 URLs enable values_plus_batch executemany."""
+    with patch("arcaneflow.orm.base.create_engine") as create_engine:
+        SQLAManager(
+            "postgresql+psycopg2://user@localhost/db", executemany_batch_page_size=200
+        )
+
+    kwargs = create_engine.call_args.kwargs
+    assert kwargs["executemany_mode"] == "values_plus_batch"
+    assert kwargs["executemany_batch_page_size"] == 200
+
+
+def test_other_drivers_keep_default_executemany():
+    """Test drivers without executemany modes get no extra option."""
+    with patch("arcaneflow.orm.base.create_engine") as create_engine:
+        SQLAManager("postgresql+psycopg://user@localhost/db")
+
+    assert "executemany_mode" not in create_engine.call_args.kwargs
+    assert "executemany_batch_page_size" not in create_engine.call_args.kwargs
+
+
+def test_get_session_returns_bound_session():
+    """Test sessions are created from the manager's sessionmaker."""
+    manager = SQLAManager("sqlite://")
+
+    with SQLAManager.managed_session(manager) as session:
+        assert session.get_bind() is manager.engine
+
+
+def test_bulk_connection_is_autocommit():
+    """Test bulk connections run with AUTOCOMMIT isolation."""
+    manager = SQLAManager("sqlite://")
+
+    with manager.bulk_connection() as connection:
+        assert connection.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+        assert connection.exec_driver_sql("SELECT 1").scalar() == 1
+
+
+def _pragma(manager, name):
+    with manager.engine.connect() as connection:
+        return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_file_sqlite_gets_pragmas(tmp_path):
+    """Test file-backed SQLite connections use WAL and the given overrides."""
+    manager = SQLAManager(
+        f"sqlite:///{tmp_path / 'etl.db'}", sqlite_pragmas={"busy_timeout": 1234}
+    )
+
+    assert _pragma(manager, "journal_mode") == "wal"
+    assert _pragma(manager, "synchronous") == 1  # NORMAL
+    assert _pragma(manager, "busy_timeout") == 1234
+
+
+def test_memory_sqlite_is_left_untouched():
+    """Test in-memory SQLite keeps the default journal mode."""
+    manager = SQLAManager("sqlite://")
+
+    assert _pragma(manager, "journal_mode") == "memory"
+
+
+def test_pool_neither_pings_nor_recycles_by_default():
+    """Test engines skip pre-ping and keep pooled connections by default."""
+    manager = SQLAManager("sqlite:///file.db")
+
+    assert manager.engine.pool._pre_ping is False
+    assert manager.engine.pool._recycle == -1
+
+
+def test_pool_recycle_is_applied_when_set():
+    """Test an explicit pool_recycle reaches the engine's pool."""
+    manager = SQLAManager("sqlite:///file.db", pool_recycle=3600)
+
+    assert manager.engine.pool._recycle == 3600
+
+
+@pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:"])
+def test_memory_sqlite_never_recycles(url):
+    """Test in-memory SQLite keeps its only connection, and with it the data."""
+    manager = SQLAManager(url, pool_recycle=1)
+
+    assert manager.engine.pool._recycle == -1
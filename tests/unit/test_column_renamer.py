@@ -1,3 +1,7 @@
+import itertools
+import subprocess
+import sys
+
 import pandas as pd
 from arcaneflow.transformations.column_operations.rename import ColumnRenamer
 from arcaneflow.core.interfaces.etl_node import PipelineContext
@@ -12,3 +16,115 @@ def test_column_renamer():
 
     assert "new_name" in result.data.columns
     assert "old_name" not in result.data.columns
+
+
+def test_fused_renamer_matches_sequential_renames():
+    df = pd.DataFrame({"a": [1], "b": [2], "c": [3], "d": [4]})
+    first = ColumnRenamer({"a": "x", "b": "y"})
+    second = ColumnRenamer({"x": "z", "c": "a", "b": "q"})
+
+    sequential = second.execute(first.execute(PipelineContext(data=df))).data
+    fused = first.fuse(second).execute(PipelineContext(data=df)).data
+
+    assert list(fused.columns) == list(sequential.columns) == ["z", "y", "a", "d"]
+
+
+def test_fused_renamer_matches_sequential_renames_on_label_collisions():
+    df = pd.DataFrame([[1, 2]], columns=["a", "b"])
+    first, second = ColumnRenamer({"a": "b"}), ColumnRenamer({"b": "c"})
+
+    sequential = second.execute(first.execute(PipelineContext(data=df))).data
+    fused = first.fuse(second).execute(PipelineContext(data=df)).data
+
+    assert list(fused.columns) == list(sequential.columns) == ["c", "c"]
+
+
+def test_fused_renamer_matches_sequential_renames_exhaustively():
+    labels = ["a", "b", "c"]
+    mappings = [
+        dict(zip(keys, values))
+        for size in (1, 2)
+        for keys in itertools.combinations(labels[:2], size)
+        for values in itertools.product(labels, repeat=size)
+    ]
+    frames = [
+        pd.DataFrame([range(len(columns))], columns=columns)
+        for columns in (["a", "b"], ["b", "a", "c"], ["a", "a"])
+    ]
+
+    for first, second in itertools.product(mappings, repeat=2):
+        fused = ColumnRenamer(first).fuse(ColumnRenamer(second))
+        if fused is None:
+            continue
+        for df in frames:
+            sequential = ColumnRenamer(second).execute(
+                ColumnRenamer(first).execute(PipelineContext(data=df))
+            )
+            result = fused.execute(PipelineContext(data=df))
+            assert list(result.data.columns) == list(sequential.data.columns), (
+                first,
+                second,
+                list(df.columns),
+            )
+
+
+def test_fuse_of_cancelling_renames_is_refused():
+    swap = {"a": "b", "b": "a"}
+    assert ColumnRenamer(swap).fuse(ColumnRenamer(swap)) is None
+
+
+def test_fuse_with_other_node_type_is_refused():
+    assert ColumnRenamer({"a": "b"}).fuse(object()) is None
+
+
+def test_column_renamer_does_not_copy_data():
+    df = pd.DataFrame({"old_name": [1, 2, 3]})
+
+    result = ColumnRenamer({"old_name": "new_name"}).execute(PipelineContext(data=df))
+
+    assert result.data is not df
+    assert list(df.columns) == ["old_name"]
+    assert result.data["new_name"].to_numpy().base is df["old_name"].to_numpy().base
+
+
+def test_node_id_is_stable_across_processes():
+    script = (
+        "from arcaneflow.transformations.column_operations.rename import ColumnRenamer;"
+        "print(ColumnRenamer({'b': 'y', 'a': 'x'}).node_id)"
+    )
+    ids = {
+        subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        for _ in range(2)
+    }
+
+    assert ids == {ColumnRenamer({"a": "x", "b": "y"}).node_id}
+
+
+def test_column_renamer_accepts_mixed_label_types():
+    """Test mappings mixing integer and string labels build and rename."""
+    df = pd.DataFrame({0: [1], "a": [2]})
+    renamer = ColumnRenamer({0: "zero", "a": "b"})
+
+    result = renamer.execute(PipelineContext(data=df))
+
+    assert list(result.data.columns) == ["zero", "b"]
+    assert renamer.node_id == ColumnRenamer({"a": "b", 0: "zero"}).node_id
+
+
+def test_column_renamer_ignores_missing_columns():
+    df = pd.DataFrame({"a": [1], "b": [2]})
+    renamer = ColumnRenamer({"a": "x", "missing": "y"})
+
+    result = renamer.execute(PipelineContext(data=df))
+
+    assert list(result.data.columns) == ["x", "b"]
+
+
+def test_column_renamer_records_columns_as_tuple():
+    df = pd.DataFrame({"old_name": [1], 0: [2]})
+
+    result = ColumnRenamer({"old_name": "new_name"}).execute(PipelineContext(data=df))
+
+    assert result.metadata["columns"] == ("new_name", 0)